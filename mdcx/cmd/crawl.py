@@ -1,32 +1,88 @@
 import asyncio
 import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
+from urllib.parse import urlsplit
 
 import typer
-from rich import print, print_json
-from rich.console import Console
+from rich import print
+from rich.console import Console, Group, RenderableType
+from rich.json import JSON
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.text import Text
 
-from ..browser import BrowserProvider
 from ..config.manager import manager
 from ..config.models import Language, Website
-from ..crawler import Never
-from ..crawlers import get_crawler_compat
-from ..crawlers.base import GenericBaseCrawler, get_crawler
-from ..crawlers.base.compat import LegacyCrawler
 from ..manual import ManualConfig
-from ..models.types import CrawlerInput
+from ..models.types import CrawlerInput, CrawlerResponse, CrawlerResult
 from ..utils import executor
-from ..web_async import AsyncWebClient
+from ..web_async import AsyncWebClient, backoff_delay
+
+# 爬虫及浏览器相关模块导入较慢, 仅在需要时导入, 使 --help 和 show-config 等命令能快速启动
+if TYPE_CHECKING:
+    from typing import Never
+
+    from patchright.async_api import Page
+
+    from ..browser import BrowserProvider
+    from ..crawlers.base import GenericBaseCrawler
+    from ..crawlers.base.compat import LegacyCrawler
 
 app = typer.Typer(help="爬虫调试工具", context_settings={"help_option_names": ["-h", "--help"]})
 console = Console()
 os.environ["MDCX_SHOW_BROWSER"] = "1"  # 显示浏览器界面
 
 proxy_help = "代理地址 (例如: http://127.0.0.1:7890). 如未指定将加载 config 设置"
+pool_size_help = "连接池大小, 即最大并发连接数"
+http2_help = "对 HTTPS 请求使用 HTTP/2, http:// URL 仍使用 HTTP/1.1. 默认由 impersonate 的浏览器指纹决定"
+backoff_base_help = "重试等待基础时间（秒）. 第 n 次重试前等待 min(backoff-max, backoff-base * 2^n) 秒"
+backoff_max_help = "单次重试等待时间上限（秒）"
+jitter_help = "重试等待时间的随机抖动比例, 实际等待时间在 (1 ± jitter) 倍之间, 避免并发请求同时重试"
+keep_alive_expiry_help = "空闲连接保留时间（秒）, 超过后不再复用. 较长的保留时间便于重试时复用已有连接"
+concurrency_help = "默认线程池大小, 用于文件读写等阻塞操作. 默认为 min(32, max(8, 2 * 网站数))"
+overall_timeout_help = "单个网站爬虫的总超时时间（秒）, 包括所有请求及重试. 默认不限制"
+
+_browser_provider: "BrowserProvider | None" = None
+
+
+def _get_browser_provider() -> "BrowserProvider":
+    """获取共享的 BrowserProvider, 首次调用时创建. close 后可继续复用"""
+    global _browser_provider
+    if _browser_provider is None:
+        from ..browser import BrowserProvider
+
+        _browser_provider = BrowserProvider(manager.config)
+    return _browser_provider
+
+
+_default_thread_pool: tuple[int, ThreadPoolExecutor] | None = None
+
+
+def _set_default_thread_pool(max_workers: int):
+    """为后台执行器的事件循环设置指定大小的默认线程池. 必须在该循环中调用
+
+    asyncio 默认线程池为 min(32, cpu + 4), 对 I/O 密集任务可能不足.
+    事件循环长期存在, 因此复用大小相同的线程池, 替换时关闭先前设置的线程池.
+    """
+    global _default_thread_pool
+    if _default_thread_pool is not None and _default_thread_pool[0] == max_workers:
+        return
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    executor.loop.set_default_executor(pool)
+    if _default_thread_pool is not None:
+        _default_thread_pool[1].shutdown(wait=False)
+    _default_thread_pool = (max_workers, pool)
+
+
+@lru_cache
+def _config_proxy() -> str | None:
+    """config 中设置的代理, 仅解析一次"""
+    return manager.config.proxy if manager.config.use_proxy else None
 
 
 @app.callback(invoke_without_command=True)
@@ -48,6 +104,14 @@ def main(
     proxy: Annotated[str | None, typer.Option("--proxy", "-p", help=proxy_help)] = None,
     timeout: Annotated[int, typer.Option("--timeout", "-t", help="请求超时时间（秒）")] = 5,
     retry: Annotated[int, typer.Option("--retry", "-r", help="重试次数")] = 1,
+    pool_size: Annotated[int, typer.Option("--pool-size", help=pool_size_help)] = 100,
+    http2: Annotated[bool, typer.Option("--http2", help=http2_help)] = False,
+    backoff_base: Annotated[float, typer.Option("--backoff-base", help=backoff_base_help)] = 0.25,
+    backoff_max: Annotated[float, typer.Option("--backoff-max", help=backoff_max_help)] = 8,
+    jitter: Annotated[float, typer.Option("--jitter", help=jitter_help)] = 0.3,
+    keep_alive_expiry: Annotated[int, typer.Option("--keep-alive-expiry", help=keep_alive_expiry_help)] = 300,
+    concurrency: Annotated[int | None, typer.Option("--concurrency", "-c", help=concurrency_help)] = None,
+    overall_timeout: Annotated[float | None, typer.Option("--overall-timeout", help=overall_timeout_help)] = None,
 ):
     """调用指定网站获取数据并保存到文件."""
 
@@ -78,66 +142,146 @@ def main(
         console.print("[red]错误: number 和 appoint_url 至少需要提供一个[/red]")
         raise typer.Exit(1)
 
-    _crawl(
-        sites=sites,
-        input=crawler_input,
-        output=output,
-        proxy=proxy,
-        timeout=timeout,
-        retry=retry,
+    # v1 爬虫使用的 manager.computed.async_client 绑定在后台执行器的事件循环上, 因此必须在该循环中运行
+    executor.run(
+        _crawl_async(
+            sites=sites,
+            input=crawler_input,
+            output=output,
+            proxy=proxy,
+            timeout=timeout,
+            retry=retry,
+            pool_size=pool_size,
+            http2=http2,
+            backoff_base=backoff_base,
+            backoff_max=backoff_max,
+            jitter=jitter,
+            keep_alive_expiry=keep_alive_expiry,
+            concurrency=concurrency or min(32, max(8, 2 * len(sites))),
+            overall_timeout=overall_timeout,
+        )
     )
 
 
-def _crawl(sites: list[Website], input: CrawlerInput, output: str | None, proxy: str | None, timeout: int, retry: int):
+class _OverallTimeoutError(TimeoutError):
+    """单个网站爬虫超过 --overall-timeout 未完成"""
+
+
+async def _crawl_async(
+    sites: list[Website],
+    input: CrawlerInput,
+    output: str | None,
+    proxy: str | None,
+    timeout: int,
+    retry: int,
+    pool_size: int,
+    http2: bool,
+    backoff_base: float,
+    backoff_max: float,
+    jitter: float,
+    keep_alive_expiry: int,
+    concurrency: int,
+    overall_timeout: float | None,
+):
+    from ..crawlers import get_crawler_compat
+
     classes = [get_crawler_compat(site) for site in sites]
 
-    client = AsyncWebClient(
-        loop=executor._loop,
-        proxy=proxy or (manager.config.proxy if manager.config.use_proxy else None),
-        retry=retry,
-        timeout=timeout,
-        log_fn=lambda msg: print(f"[dim][AsyncWebClient] {msg}[/dim]"),
-    )
+    _set_default_thread_pool(concurrency)
 
-    browser_provider = BrowserProvider(manager.config)
+    browser_provider = _get_browser_provider()
 
-    async def task(c: type[GenericBaseCrawler[Never]] | LegacyCrawler):
+    async def task(c: "type[GenericBaseCrawler[Never]] | LegacyCrawler"):
         crawler = c(
             client=client,
             base_url=manager.config.get_site_url(c.site()),
-            browser=await browser_provider.get_browser(),
+            browser=browser,
         )
         return await crawler.run(input)
 
-    futures = [executor.submit(task(c)) for c in classes]
-    executor.wait_all()
-
-    for i, f in enumerate(futures):
-        print(f"\n[blue]====== Res from site: [bold]{sites[i]}[/bold] ======[/blue]")
-        if f.exception():
-            print(f"[red]错误: {f.exception()}[/red]")
-            continue
-
-        res = f.result()
-        print("[bold blue]Debug Info:[/bold blue]")
-        print("\t" + "\n\t".join("\n".join(res.debug_info.logs).splitlines()))
-        print(f"\n[bold]耗时: {res.debug_info.execution_time:.2f} 秒[/bold]\n")
-        if res.data:
-            print("[green]成功. 结果:[/green]\n")
-            j = json.dumps(asdict(res.data), ensure_ascii=False, indent=2)
-            print_json(j)
-            if output:
-                output_path = Path(output.replace("{site}", sites[i].value))
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_text(j, encoding="utf-8")
-                print(f"[green]结果已保存到: {output_path}[/green]")
-        else:
-            print("[red]失败[/red]\n")
-            if res.debug_info.error:
-                print(f"[red]{res.debug_info.error}[/red]")
-
-
-site_help = "指定网站类型. 若未指定, 将尝试从 URL 自动检测. 若有相应 GenericBaseCrawler 实现, 将调用其 _fetch_detail 方法, 否则将直接使用 AsyncWebClient.get_text"
+    async def named(site: Website, c: "type[GenericBaseCrawler[Never]] | LegacyCrawler"):
+        # 异常作为结果返回, 避免 TaskGroup 因单个网站失败而取消其他任务
+        deadline = asyncio.timeout(overall_timeout)
+        try:
+            async with deadline:
+                return site, await task(c)
+        except TimeoutError as e:
+            # 仅当总超时触发时才视为超时, 爬虫内部抛出的 TimeoutError 按普通错误处理
+            return site, _OverallTimeoutError(f"超过 {overall_timeout} 秒未完成") if deadline.expired() else e
+        except Exception as e:
+            return site, e
+
+    try:
+        # 所有爬虫共享同一客户端, 结束时关闭连接池
+        async with AsyncWebClient(
+            loop=executor.loop,
+            proxy=proxy or _config_proxy(),
+            retry=retry,
+            timeout=timeout,
+            log_fn=lambda msg: print(f"[dim][AsyncWebClient] {msg}[/dim]"),
+            max_clients=pool_size,
+            http_version="v2tls" if http2 else None,
+            backoff_base=backoff_base,
+            backoff_max=backoff_max,
+            jitter=jitter,
+            keepalive_expiry=keep_alive_expiry,
+        ) as client:
+            # 在分发任务前启动浏览器, 所有爬虫共享同一实例
+            try:
+                browser = await browser_provider.get_browser()
+            except Exception as e:
+                # 启动失败时不使用浏览器, 依赖浏览器的爬虫将在各自结果中报错
+                browser = None
+                print(f"[red]浏览器启动失败, 将不使用浏览器: {e}[/red]")
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(named(site, c)) for site, c in zip(sites, classes, strict=True)]
+                # 按完成顺序输出结果, 无需等待最慢的网站
+                for coro in asyncio.as_completed(tasks):
+                    site, res = await coro
+                    await _print_result(site, res, output)
+    finally:
+        await browser_provider.close()
+
+
+def _dump_result(data: CrawlerResult, output_path: Path | None) -> str:
+    """序列化结果并按需保存到文件"""
+    j = json.dumps(asdict(data), ensure_ascii=False, indent=2)
+    if output_path:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(j, encoding="utf-8")
+    return j
+
+
+async def _print_result(site: Website, res: CrawlerResponse | Exception, output: str | None):
+    # 收集单个网站的全部输出后一次性打印, 减少写入次数, 也避免与其他网站的输出交错
+    parts: list[RenderableType] = [f"\n[blue]====== Res from site: [bold]{site}[/bold] ======[/blue]"]
+    if isinstance(res, Exception):
+        label = "超时" if isinstance(res, _OverallTimeoutError) else "错误"
+        parts.append(f"[red]{label}: {res}[/red]")
+        console.print(Group(*parts))
+        return
+
+    di = res.debug_info
+    data = res.data
+    parts.append("[bold blue]Debug Info:[/bold blue]")
+    parts.append(Text("\t" + "\n\t".join(line for log in di.logs for line in log.splitlines())))
+    parts.append(f"\n[bold]耗时: {di.execution_time:.2f} 秒[/bold]\n")
+    if data:
+        parts.append("[green]成功. 结果:[/green]\n")
+        output_path = Path(output.replace("{site}", site.value) if "{site}" in output else output) if output else None
+        # asdict 深拷贝及带缩进的序列化在线程中执行, 避免阻塞仍在运行的其他爬虫
+        j = await asyncio.to_thread(_dump_result, data, output_path)
+        parts.append(JSON(j))
+        if output_path:
+            parts.append(f"[green]结果已保存到: {output_path}[/green]")
+    else:
+        parts.append("[red]失败[/red]\n")
+        if di.error:
+            parts.append(f"[red]{di.error}[/red]")
+    console.print(Group(*parts))
+
+
+site_help = "指定网站类型. 若未指定, 将尝试从 URL 自动检测. 若有相应 GenericBaseCrawler 实现, 将调用其 _fetch_detail 方法, 否则将直接请求 URL 并按原始字节保存, 不进行解码或转换为 UTF-8"
 
 
 @app.command()
@@ -151,6 +295,12 @@ def fetch(
     proxy: Annotated[str | None, typer.Option("--proxy", "-p", help=proxy_help)] = None,
     timeout: Annotated[int, typer.Option("--timeout", "-t", help="请求超时时间（秒）")] = 5,
     retry: Annotated[int, typer.Option("--retry", "-r", help="重试次数")] = 1,
+    pool_size: Annotated[int, typer.Option("--pool-size", help=pool_size_help)] = 100,
+    http2: Annotated[bool, typer.Option("--http2", help=http2_help)] = False,
+    backoff_base: Annotated[float, typer.Option("--backoff-base", help=backoff_base_help)] = 0.25,
+    backoff_max: Annotated[float, typer.Option("--backoff-max", help=backoff_max_help)] = 8,
+    jitter: Annotated[float, typer.Option("--jitter", help=jitter_help)] = 0.3,
+    keep_alive_expiry: Annotated[int, typer.Option("--keep-alive-expiry", help=keep_alive_expiry_help)] = 300,
 ):
     """复用指定网站的 GenericBaseCrawler 详情页请求方法获取 URL 并保存到文件."""
 
@@ -170,6 +320,43 @@ def fetch(
             proxy=proxy,
             timeout=timeout,
             retry=retry,
+            pool_size=pool_size,
+            http2=http2,
+            backoff_base=backoff_base,
+            backoff_max=backoff_max,
+            jitter=jitter,
+            keep_alive_expiry=keep_alive_expiry,
+        )
+    )
+
+
+@app.command()
+def fetch_many(
+    urls_file: Annotated[
+        Path,
+        typer.Argument(
+            help="URL 列表文件, 每行一个 URL, 忽略空行及 # 开头的行", exists=True, dir_okay=False, readable=True
+        ),
+    ],
+    base_dir: Annotated[str, typer.Option("--base-dir", "-d", help="基础输出目录")] = "tests/crawlers/data",
+    retry: Annotated[int, typer.Option("--retry", "-r", help="重试次数")] = 1,
+    backoff_base: Annotated[float, typer.Option("--backoff-base", help=backoff_base_help)] = 0.25,
+    backoff_max: Annotated[float, typer.Option("--backoff-max", help=backoff_max_help)] = 8,
+    jitter: Annotated[float, typer.Option("--jitter", help=jitter_help)] = 0.3,
+):
+    """使用浏览器依次获取多个 URL 并保存到文件. 所有 URL 复用同一页面."""
+    urls = [u for line in urls_file.read_text(encoding="utf-8").splitlines() if (u := line.strip()) and u[0] != "#"]
+    if not urls:
+        console.print(f"[red]错误: {urls_file} 中没有 URL[/red]")
+        raise typer.Exit(1)
+    asyncio.run(
+        _fetch_many_async(
+            urls=urls,
+            base_dir=base_dir,
+            retry=retry,
+            backoff_base=backoff_base,
+            backoff_max=backoff_max,
+            jitter=jitter,
         )
     )
 
@@ -179,19 +366,25 @@ def show_config():
     """显示当前配置信息"""
     console.print("[bold blue]当前配置信息:[/bold blue]")
     console.print()
-    console.print(f"代理: {(manager.config.proxy if manager.config.use_proxy else None) or '未设置'}")
+    console.print(f"代理: {_config_proxy() or '未设置'}")
     console.print(f"超时时间: {manager.config.timeout} 秒")
     console.print(f"重试次数: {manager.config.retry}")
     console.print(f"配置文件路径: {manager.path}")
 
 
-def _detect_site_from_url(url: str) -> Website | None:
-    """从URL自动检测网站类型"""
-    url_lower = url.lower()
+# 将所有网站关键词合并为一个正则, 一次扫描即可完成匹配
+_WEB_LOWER = {k.lower(): v for k, v in ManualConfig.WEB_DIC.items()}
+_WEB_RE = re.compile("|".join(re.escape(k) for k in _WEB_LOWER), re.IGNORECASE)
+
 
-    for keyword, site in ManualConfig.WEB_DIC.items():
-        if keyword.lower() in url_lower:
-            return site
+def _detect_site_from_url(url: str) -> Website | None:
+    """从URL自动检测网站类型. 优先匹配域名, 未匹配时再匹配完整 URL"""
+    try:
+        host = urlsplit(url).hostname or ""  # hostname 已转为小写
+    except ValueError:
+        host = ""
+    if m := _WEB_RE.search(host) or _WEB_RE.search(url):
+        return _WEB_LOWER[m.group(0).lower()]
     return None
 
 
@@ -205,11 +398,17 @@ async def _fetch_async(
     proxy: str | None,
     timeout: int,
     retry: int,
+    pool_size: int,
+    http2: bool,
+    backoff_base: float,
+    backoff_max: float,
+    jitter: float,
+    keep_alive_expiry: int,
 ):
     """异步获取详情页内容"""
 
     # 配置网络客户端
-    client_proxy = proxy or (manager.config.proxy if manager.config.use_proxy else None)
+    client_proxy = proxy or _config_proxy()
     client_timeout = timeout or manager.config.timeout
     client_retry = retry or manager.config.retry
 
@@ -219,73 +418,83 @@ async def _fetch_async(
     if client_proxy:
         console.print(f"[cyan]代理: {client_proxy}[/cyan]")
 
-    # 创建异步客户端
-    async_client = AsyncWebClient(
-        proxy=client_proxy,
-        retry=client_retry,
-        timeout=client_timeout,
-        log_fn=lambda msg: console.print(f"[dim][AsyncWebClient] {msg}[/dim]"),
-    )
-
-    browser_provider = BrowserProvider(manager.config)
+    browser_provider = _get_browser_provider()
 
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("正在获取详情页...", total=None)
-            if website:
-                crawler_class = get_crawler(website)
-                if crawler_class is None:
-                    console.print(f"[red]错误: 未找到 {website.value} Crawler[/red]")
-                    exit(1)
-
-                crawler = crawler_class(
-                    client=async_client,
-                    base_url=manager.config.get_site_url(website),
-                    browser=await browser_provider.get_browser() if use_browser else None,
-                )
-                crawler_input = CrawlerInput.empty()
-                crawler_input.appoint_url = url
-                progress.update(task, description="正在请求详情页...")
-                # 设为 None 以根据是否传入 browser 参数决定是否使用浏览器
-                html, error = await crawler._fetch_detail(crawler.new_context(crawler_input), url, None)
-            elif use_browser:
-                progress.update(task, description="正在通过浏览器请求详情页...")
-                browser = await browser_provider.get_browser()
-                try:
-                    async with await browser.new_page() as page:
-                        await page.goto(url, wait_until="load")
-                        html = await page.content()
-                        error = ""
-                except Exception as e:
-                    html, error = None, str(e)
-            else:
-                progress.update(task, description="正在请求详情页...")
-                html, error = await async_client.get_text(url)
-
-            if html is None:
-                console.print(f"[red]错误: 获取详情页失败 - {error}[/red]")
-                return
-
-            progress.update(task, description="请求成功，正在保存...")
-
-            # 确定输出路径
-            output_file = _determine_output_path(output_path, url, website, number, base_dir)
-
-            # 创建输出目录
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-
-            # 保存HTML内容
-            output_file.write_text(html, encoding="utf-8")
-
-            progress.remove_task(task)
+        # 创建异步客户端, 连接池在整个请求过程 (包括重试) 中复用
+        async with AsyncWebClient(
+            proxy=client_proxy,
+            retry=client_retry,
+            timeout=client_timeout,
+            log_fn=lambda msg: console.print(f"[dim][AsyncWebClient] {msg}[/dim]"),
+            max_clients=pool_size,
+            http_version="v2tls" if http2 else None,
+            backoff_base=backoff_base,
+            backoff_max=backoff_max,
+            jitter=jitter,
+            keepalive_expiry=keep_alive_expiry,
+        ) as async_client:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                task = progress.add_task("正在获取详情页...", total=None)
+
+                # 确定输出路径
+                output_file = _determine_output_path(output_path, url, website, number, base_dir)
+
+                html: str | None = None
+                size: int | None = None
+                if website:
+                    from ..crawlers import get_crawler
+
+                    crawler_class = get_crawler(website)
+                    if crawler_class is None:
+                        console.print(f"[red]错误: 未找到 {website.value} Crawler[/red]")
+                        exit(1)
+
+                    crawler = crawler_class(
+                        client=async_client,
+                        base_url=manager.config.get_site_url(website),
+                        browser=await browser_provider.get_browser() if use_browser else None,
+                    )
+                    crawler_input = CrawlerInput.empty()
+                    crawler_input.appoint_url = url
+                    progress.update(task, description="正在请求详情页...")
+                    # 设为 None 以根据是否传入 browser 参数决定是否使用浏览器
+                    html, error = await crawler._fetch_detail(crawler.new_context(crawler_input), url, None)
+                elif use_browser:
+                    progress.update(task, description="正在通过浏览器请求详情页...")
+                    browser = await browser_provider.get_browser()
+                    try:
+                        async with await browser.new_page() as page:
+                            html, error = await _goto(page, url, client_retry, backoff_base, backoff_max, jitter)
+                    except Exception as e:
+                        html, error = None, str(e)
+                else:
+                    progress.update(task, description="正在请求详情页...")
+                    # 直接流式写入文件, 不在内存中保留完整响应
+                    size, error = await async_client.stream_to_file(url, output_file)
+
+                if html is not None:
+                    progress.update(task, description="请求成功，正在保存...")
+                    # 创建输出目录
+                    output_file.parent.mkdir(parents=True, exist_ok=True)
+                    # 保存HTML内容
+                    _write_file(output_file, html)
+                    size_info = f"{len(html)} 字符"
+                elif size is not None:
+                    size_info = f"{size} 字节"
+                else:
+                    console.print(f"[red]错误: 获取详情页失败 - {error}[/red]")
+                    return
+
+                progress.remove_task(task)
 
         console.print("[green]✅ 获取成功![/green]")
         console.print(f"[green]文件已保存到: {output_file}[/green]")
-        console.print(f"[dim]文件大小: {len(html)} 字符[/dim]")
+        console.print(f"[dim]文件大小: {size_info}[/dim]")
 
     except Exception as e:
         console.print(f"[red]错误: {str(e)}[/red]")
@@ -294,6 +503,80 @@ async def _fetch_async(
         await browser_provider.close()
 
 
+async def _goto(
+    page: "Page", url: str, retries: int, backoff_base: float, backoff_max: float, jitter: float
+) -> tuple[str | None, str]:
+    """在给定页面中加载 URL 并返回 HTML. 失败时在同一页面上重试, 避免重复创建页面. 重试等待与 AsyncWebClient 相同"""
+    error = ""
+    for attempt in range(max(retries, 1)):
+        try:
+            await page.goto(url, wait_until="load")
+            return await page.content(), ""
+        except Exception as e:
+            error = str(e)
+        if attempt < retries - 1:
+            await asyncio.sleep(backoff_delay(attempt, backoff_base, backoff_max, jitter))
+    return None, error
+
+
+async def _fetch_many_async(
+    urls: list[str], base_dir: str, retry: int, backoff_base: float, backoff_max: float, jitter: float
+):
+    """使用同一浏览器页面依次获取多个 URL"""
+    browser_provider = _get_browser_provider()
+    failed = 0
+    saved: set[Path] = set()
+    try:
+        browser = await browser_provider.get_browser()
+        async with await browser.new_page() as page:
+            for i, url in enumerate(urls, 1):
+                console.print(f"[cyan]({i}/{len(urls)}) 正在获取: {url}[/cyan]")
+                html, error = await _goto(page, url, retry, backoff_base, backoff_max, jitter)
+                if html is None:
+                    failed += 1
+                    console.print(f"[red]错误: 获取失败 - {error}[/red]")
+                    continue
+                output_file = _determine_output_path(None, url, _detect_site_from_url(url), None, base_dir)
+                if output_file in saved:
+                    # 文件名仅取自 URL 最后一段, 不同 URL 可能重名, 避免覆盖本次已保存的文件
+                    deduped = _dedup_output_path(output_file, saved)
+                    console.print(f"[yellow]警告: {output_file} 已被先前的 URL 使用, 改为保存到 {deduped}[/yellow]")
+                    output_file = deduped
+                saved.add(output_file)
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+                _write_file(output_file, html)
+                console.print(f"[green]文件已保存到: {output_file}[/green]")
+    except Exception as e:
+        console.print(f"[red]错误: {str(e)}[/red]")
+        raise typer.Exit(1)
+    finally:
+        await browser_provider.close()
+
+    console.print(f"[green]完成: 成功 {len(urls) - failed} 个, 失败 {failed} 个[/green]")
+
+
+def _dedup_output_path(path: Path, used: set[Path]) -> Path:
+    """在文件名后追加 _2, _3 ... 直到不与 used 中的路径重复"""
+    n = 2
+    while (candidate := path.with_name(f"{path.stem}_{n}{path.suffix}")) in used:
+        n += 1
+    return candidate
+
+
+def _write_file(path: Path, data: str | bytes):
+    """写入文件. str 仅编码一次, 并直接通过 os.write 写入, 跳过 Python 层的文件缓冲"""
+    buf = memoryview(data.encode("utf-8") if isinstance(data, str) else data)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        while buf:
+            buf = buf[os.write(fd, buf) :]
+    finally:
+        os.close(fd)
+
+
+_SANITIZE_TBL = str.maketrans({"=": "_", "?": "_", "&": "_"})
+
+
 def _determine_output_path(
     output_path: str | None, url: str, site: Website | None, number: str | None, base_dir: str
 ) -> Path:
@@ -308,15 +591,9 @@ def _determine_output_path(
     if number:
         filename = f"{number}.html"
     else:
-        # 尝试从URL提取标识符
-        url_parts = url.strip("/").split("/")
-        if url_parts:
-            identifier = url_parts[-1]
-            # 清理文件名
-            identifier = identifier.replace("=", "_").replace("?", "_").replace("&", "_")
-            filename = f"{identifier}.html"
-        else:
-            filename = "detail.html"
+        # 尝试从URL提取标识符, 并清理文件名
+        identifier = url.strip("/").rsplit("/", 1)[-1].translate(_SANITIZE_TBL)
+        filename = f"{identifier}.html" if identifier else "detail.html"
 
     if site:
         return base_path / site.value / filename
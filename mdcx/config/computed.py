@@ -27,7 +27,7 @@ class Computed:
         )
 
         self.async_client = AsyncWebClient(
-            loop=executor._loop,
+            loop=executor.loop,
             proxy=proxy,
             retry=config.retry,
             timeout=config.timeout,
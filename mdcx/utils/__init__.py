@@ -32,6 +32,11 @@ class AsyncBackgroundExecutor:
         self._running = False
         self._start_background_thread()
 
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """后台线程中运行的事件循环"""
+        return self._loop
+
     def submit(self, coro: Coroutine[Any, Any, T]) -> Future[T]:
         """提交一个协程到后台线程执行, 返回一个 Future 对象. 此方法线程安全且非阻塞."""
         future = asyncio.run_coroutine_threadsafe(coro, self._loop)
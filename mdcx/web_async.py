@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import random
 from collections.abc import Callable
 from io import BytesIO
@@ -8,10 +9,10 @@ from typing import Any
 import aiofiles
 import httpx
 from aiolimiter import AsyncLimiter
-from curl_cffi import AsyncSession, Response
+from curl_cffi import AsyncSession, CurlOpt, Response
 from curl_cffi.requests.exceptions import ConnectionError, RequestException, Timeout
 from curl_cffi.requests.session import HttpMethod
-from curl_cffi.requests.utils import not_set
+from curl_cffi.requests.utils import HttpVersionLiteral, not_set
 from PIL import Image
 
 
@@ -31,6 +32,19 @@ class AsyncWebLimiters:
             del self.limiters[key]
 
 
+def backoff_delay(attempt: int, base: float, max_delay: float, jitter: float) -> float:
+    """计算第 attempt 次重试前的等待时间 (秒). 随机抖动可避免多个并发请求同时重试"""
+    delay = min(max_delay, base * 2**attempt)
+    return delay * random.uniform(1 - jitter, 1 + jitter)
+
+
+async def _abort_stream(resp: Response):
+    """中止并关闭流式响应. curl_cffi 的 aclose 只等待后台下载结束, 需先设置 quit_now 使其停止接收数据"""
+    if resp.quit_now is not None:
+        resp.quit_now.set()
+    await resp.aclose()
+
+
 class AsyncWebClient:
     def __init__(
         self,
@@ -41,21 +55,54 @@ class AsyncWebClient:
         log_fn: Callable[[str], None] | None = None,
         limiters: AsyncWebLimiters | None = None,
         loop=None,
+        max_clients: int = 50,
+        http_version: HttpVersionLiteral | None = None,
+        backoff_base: float = 2,
+        backoff_max: float = 10,
+        jitter: float = 0.3,
+        keepalive_expiry: int | None = None,
     ):
+        """
+        Args:
+            max_clients: 连接池中 curl handle 的最大数量, 决定最大并发连接数
+            http_version: 限定 HTTP 版本, 如 "v2tls". 为 None 时由 impersonate 决定
+            backoff_base: 重试等待的基础时间 (秒), 第 n 次重试前等待 base * 2^n 秒
+            backoff_max: 单次重试等待时间上限 (秒)
+            jitter: 等待时间的随机抖动比例, 实际等待时间在 [1 - jitter, 1 + jitter] 倍之间
+            keepalive_expiry: 空闲连接的最长保留时间 (秒), 超过后不再复用. 为 None 时使用 curl 默认值 118 秒
+        """
         self.retry = retry
         self.proxy = proxy
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
         self.curl_session = AsyncSession(
             loop=loop,
-            max_clients=50,
+            max_clients=max_clients,
             verify=False,
             max_redirects=20,
             timeout=timeout,
             impersonate=random.choice(["chrome123", "chrome124", "chrome131", "chrome136", "firefox133", "firefox135"]),
+            http_version=http_version,
+            curl_options={CurlOpt.MAXAGE_CONN: keepalive_expiry} if keepalive_expiry is not None else None,
         )
 
         self.log_fn = log_fn if log_fn is not None else lambda _: None
         self.limiters = limiters if limiters is not None else AsyncWebLimiters()
 
+    def _backoff_delay(self, attempt: int) -> float:
+        return backoff_delay(attempt, self.backoff_base, self.backoff_max, self.jitter)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """关闭底层 session, 释放连接池"""
+        await self.curl_session.close()
+
     def _prepare_headers(self, url: str | None = None, headers: dict[str, str] | None = None) -> dict[str, str]:
         """预处理请求头"""
         if not headers:
@@ -135,6 +182,8 @@ class AsyncWebClient:
                             429,  # Too Many Requests
                             504,  # Gateway Timeout
                         )
+                        if stream:
+                            await _abort_stream(resp)
                     else:
                         self.log_fn(f"✅ {method} {url} 成功")
                         return resp, ""
@@ -151,7 +200,7 @@ class AsyncWebClient:
                 self.log_fn(f"🔴 {method} {url} 失败: {error_msg} ({attempt + 1}/{retry_count})")
                 # 重试前等待
                 if attempt < retry_count - 1:
-                    await asyncio.sleep(attempt * 3 + 2)
+                    await asyncio.sleep(self._backoff_delay(attempt))
             return None, f"{method} {url} 失败: {error_msg}"
         except Exception as e:
             error_msg = f"{method} {url} 未知错误:  {str(e)}"
@@ -192,6 +241,30 @@ class AsyncWebClient:
 
         return resp.content, ""
 
+    async def stream_to_file(self, url: str, file_path: Path, *, use_proxy: bool = True) -> tuple[int | None, str]:
+        """流式请求并逐块写入文件, 不在内存中缓存完整响应. 返回 (写入字节数, 错误信息)"""
+        resp, error = await self.request("GET", url, use_proxy=use_proxy, stream=True)
+        if resp is None:
+            return None, error
+        size = 0
+        try:
+            # 请求成功后再创建目录, 避免失败时留下空目录
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            async with aiofiles.open(file_path, "wb") as f:
+                async for chunk in resp.aiter_content():
+                    await f.write(chunk)
+                    size += len(chunk)
+        except RequestException as e:
+            error = f"下载中断: {str(e)}"
+        except Exception as e:
+            error = f"文件写入失败: {str(e)}"
+        else:
+            return size, ""
+        await _abort_stream(resp)
+        with contextlib.suppress(OSError):
+            file_path.unlink(missing_ok=True)
+        return None, error
+
     async def get_json(
         self,
         url: str,
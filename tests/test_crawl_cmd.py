@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+
+from mdcx.cmd.crawl import _dedup_output_path, _detect_site_from_url, _determine_output_path
+from mdcx.config.models import Website
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://www.javbus.com/ABC-123", Website.JAVBUS),
+        ("https://WWW.JAVBUS.COM/ABC-123", Website.JAVBUS),
+        ("https://www.dmm.co.jp/digital/videoa/-/detail/=/cid=abc123/", Website.DMM),
+        ("https://airav.io/video?hid=1", Website.AIRAV_CC),
+        ("https://example.com/?q=1", None),
+        # 多个关键词时取最靠左的匹配, 而非 WEB_DIC 中的顺序 (avsox 在 prestige 之前)
+        ("https://example.com/prestige/avsox", Website.PRESTIGE),
+    ],
+)
+def test_detect_site_from_url(url, expected):
+    assert _detect_site_from_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        # 域名与路径均含关键词时以域名为准
+        ("https://iqq5.xyz/cn/avsox", Website.IQQTV),
+        ("https://avsox.click/cn/search/javbus", Website.AVSOX),
+        # userinfo 中的关键词虽更靠左, 仍以域名为准
+        ("https://javbus@avsox.click/cn", Website.AVSOX),
+        # 域名未匹配时回退到完整 URL
+        ("https://example.com/javbus/ABC-123", Website.JAVBUS),
+        # urlsplit 无法解析的 URL 直接匹配完整 URL
+        ("http://[bad/javbus", Website.JAVBUS),
+        ("http://[bad", None),
+    ],
+)
+def test_detect_site_from_url_host_first(url, expected):
+    assert _detect_site_from_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    "url,site,number,expected",
+    [
+        ("https://www.javbus.com/ABC-123", Website.JAVBUS, None, "data/javbus/ABC-123.html"),
+        ("https://www.javbus.com/ABC-123/", None, None, "data/ABC-123.html"),
+        ("https://example.com/detail?id=1&b=2", None, None, "data/detail_id_1_b_2.html"),
+        ("https://www.javbus.com/ABC-123", Website.JAVBUS, "SSIS-001", "data/javbus/SSIS-001.html"),
+        # 无法提取标识符时使用 detail.html
+        ("/", None, None, "data/detail.html"),
+        ("", Website.JAVBUS, None, "data/javbus/detail.html"),
+    ],
+)
+def test_determine_output_path(url, site, number, expected):
+    assert _determine_output_path(None, url, site, number, "data") == Path(expected)
+
+
+def test_determine_output_path_explicit():
+    assert _determine_output_path("out/a.html", "https://www.javbus.com/ABC-123", Website.JAVBUS, None, "data") == Path(
+        "out/a.html"
+    )
+
+
+def test_dedup_output_path():
+    used = {Path("data/javbus/ABC-123.html")}
+    assert _dedup_output_path(Path("data/javbus/ABC-123.html"), used) == Path("data/javbus/ABC-123_2.html")
+    used.add(Path("data/javbus/ABC-123_2.html"))
+    assert _dedup_output_path(Path("data/javbus/ABC-123.html"), used) == Path("data/javbus/ABC-123_3.html")
@@ -0,0 +1,41 @@
+import pytest
+
+from mdcx import web_async
+from mdcx.web_async import backoff_delay
+
+
+@pytest.mark.parametrize(
+    "attempt,expected",
+    [
+        (0, 0.25),
+        (1, 0.5),
+        (2, 1.0),
+        (5, 8.0),
+        (6, 8.0),  # 达到上限
+        (20, 8.0),
+    ],
+)
+def test_backoff_delay_exponential_and_capped(monkeypatch, attempt, expected):
+    monkeypatch.setattr(web_async.random, "uniform", lambda a, b: 1.0)
+    assert backoff_delay(attempt, 0.25, 8, 0.3) == pytest.approx(expected)
+
+
+def test_backoff_delay_jitter_bounds(monkeypatch):
+    calls = []
+
+    def fake_uniform(a, b):
+        calls.append((a, b))
+        return a
+
+    monkeypatch.setattr(web_async.random, "uniform", fake_uniform)
+    assert backoff_delay(3, 1, 100, 0.3) == pytest.approx(8 * 0.7)
+    assert calls == [(pytest.approx(0.7), pytest.approx(1.3))]
+
+    monkeypatch.setattr(web_async.random, "uniform", lambda a, b: b)
+    # 上限作用于抖动之前
+    assert backoff_delay(10, 1, 5, 0.3) == pytest.approx(5 * 1.3)
+
+
+def test_backoff_delay_without_jitter():
+    assert backoff_delay(2, 2, 10, 0) == 8
+    assert backoff_delay(3, 2, 10, 0) == 10